@@ -6,15 +6,33 @@ synchronous and asynchronous operations, error handling, and retries.
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import os
+import random
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    _loads = json.loads
 
 
 # Configure logging
@@ -38,6 +56,123 @@ class FortitudeAPIError(Exception):
         return f"FortitudeAPIError({self.status_code}): {self.error_code} - {self.message}"
 
 
+MAX_RETRY_DELAY = 30.0
+
+# Cache keys whose parameter values exceed this length are hashed to a fixed-size digest
+MAX_INLINE_KEY_PARAM_LENGTH = 256
+
+# Request bodies larger than this are gzip-compressed when compress_requests is enabled
+COMPRESSION_THRESHOLD = 1024
+
+
+def _retry_delay(attempt: int, retry_after: str = None) -> float:
+    """Honor a numeric Retry-After header, otherwise use capped full-jitter backoff."""
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    return random.uniform(0, min(2 ** attempt, MAX_RETRY_DELAY))
+
+
+def _success_body(status_code: int, body: bytes) -> Any:
+    """Decode a 2xx response body; empty bodies (e.g. 204) decode to {}."""
+    if not body:
+        return {}
+    try:
+        return _loads(body)
+    except ValueError:  # json and orjson decode errors both subclass ValueError
+        raise FortitudeAPIError(f"Invalid JSON in HTTP {status_code} response", status_code=status_code)
+
+
+def _api_error(status_code: int, body: bytes) -> FortitudeAPIError:
+    """Build a FortitudeAPIError from an error response body, JSON or not."""
+    try:
+        error_data = _loads(body)
+    except ValueError:
+        error_data = None
+    
+    if not isinstance(error_data, dict):
+        return FortitudeAPIError(
+            message=f"HTTP {status_code}: {body.decode('utf-8', 'replace')}",
+            status_code=status_code
+        )
+    return FortitudeAPIError(
+        message=error_data.get('message', 'Unknown error'),
+        error_code=error_data.get('error_code'),
+        status_code=status_code,
+        request_id=error_data.get('request_id'),
+        details=error_data.get('details')
+    )
+
+
+def _encode_body(data: Optional[Dict], compress: bool) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+    """Serialize a request payload, gzip-compressing it when enabled and large enough."""
+    if data is None:
+        return None, None
+    body = _dumps(data)
+    if compress and len(body) > COMPRESSION_THRESHOLD:
+        return gzip.compress(body, compresslevel=6), {'Content-Encoding': 'gzip'}
+    return body, None
+
+
+def _cache_key(method: str, url: str, params: Optional[Dict]) -> Any:
+    """Build a response-cache key, hashing it when long parameter values would bloat the cache."""
+    items = tuple(sorted(params.items())) if params else ()
+    if any(isinstance(value, str) and len(value) > MAX_INLINE_KEY_PARAM_LENGTH for _, value in items):
+        return hashlib.blake2b(repr((method, url, items)).encode('utf-8'), digest_size=16).digest()
+    return (method, url, items)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket used to pace outgoing requests client-side."""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    def acquire(self):
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Process-wide sessions for clients created with share_session=True, keyed by (base_url, api_key)
+_SHARED_SESSIONS: Dict[Tuple[str, str], requests.Session] = {}
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+
+def _new_session(api_key: str, pool_maxsize: int = 32) -> requests.Session:
+    """Create a requests session with auth headers and a pooled keep-alive adapter."""
+    session = requests.Session()
+    session.headers.update({
+        'X-API-Key': api_key,
+        'Content-Type': 'application/json',
+        'User-Agent': 'Fortitude-Python-Client/1.0.0',
+        'Connection': 'keep-alive'
+    })
+    
+    # Larger keep-alive pool; retries stay in _make_request since they are status-aware
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize,
+                          max_retries=Retry(total=0, connect=0))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class FortitudeClient:
     """Synchronous Fortitude API client."""
     
@@ -47,7 +182,14 @@ class FortitudeClient:
                  timeout: int = None,
                  max_retries: int = None,
                  enable_cache: bool = False,
-                 cache_ttl: int = 300):
+                 cache_ttl: int = 300,
+                 max_cache_entries: int = 1024,
+                 max_per_second: float = None,
+                 max_burst: int = None,
+                 negative_cache_ttl: float = 2,
+                 compress_requests: bool = False,
+                 share_session: bool = False,
+                 pool_maxsize: int = 32):
         """
         Initialize the Fortitude API client.
         
@@ -58,6 +200,15 @@ class FortitudeClient:
             max_retries: Maximum retry attempts (default: 3)
             enable_cache: Enable response caching (default: False)
             cache_ttl: Cache TTL in seconds (default: 300)
+            max_cache_entries: Maximum cached responses before LRU eviction (default: 1024)
+            max_per_second: Client-side request rate limit (default: unlimited)
+            max_burst: Requests allowed in a burst before pacing kicks in (default: max_per_second)
+            negative_cache_ttl: Seconds to remember 404 responses when caching (default: 2)
+            compress_requests: Gzip request bodies over 1KB; the server must accept
+                Content-Encoding: gzip (default: False)
+            share_session: Reuse one process-wide session per base URL and API key so
+                short-lived clients share pooled connections (default: False)
+            pool_maxsize: Keep-alive connections pooled per host (default: 32)
         """
         self.api_key = api_key or os.getenv('FORTITUDE_API_KEY')
         self.base_url = (base_url or os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')).rstrip('/')
@@ -67,83 +218,113 @@ class FortitudeClient:
         if not self.api_key:
             raise ValueError("API key is required. Set FORTITUDE_API_KEY environment variable or pass api_key parameter.")
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json',
-            'User-Agent': 'Fortitude-Python-Client/1.0.0'
-        })
+        self.share_session = share_session
+        if share_session:
+            with _SHARED_SESSIONS_LOCK:
+                key = (self.base_url, self.api_key)
+                if key not in _SHARED_SESSIONS:
+                    _SHARED_SESSIONS[key] = _new_session(self.api_key, pool_maxsize)
+                self.session = _SHARED_SESSIONS[key]
+        else:
+            self.session = _new_session(self.api_key, pool_maxsize)
         
-        # Simple in-memory cache
+        # In-memory LRU cache
         self.enable_cache = enable_cache
         self.cache_ttl = cache_ttl
-        self._cache = {}
+        self.max_cache_entries = max_cache_entries
+        self.negative_cache_ttl = negative_cache_ttl
+        self.compress_requests = compress_requests
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Optional client-side rate limiting; retry-on-429 remains as a safety net
+        self._bucket = _TokenBucket(max_per_second, max_burst or max(1, int(max_per_second))) \
+            if max_per_second else None
         
         logger.info(f"Initialized Fortitude client for {self.base_url}")
     
+    def _cache_get(self, cache_key: Any) -> Optional[Dict[str, Any]]:
+        """Return a fresh cache entry and mark it recently used; expired entries are dropped."""
+        with self._cache_lock:
+            cache_entry = self._cache.get(cache_key)
+            if cache_entry is None:
+                return None
+            ttl = self.negative_cache_ttl if 'error' in cache_entry else self.cache_ttl
+            if time.time() - cache_entry['timestamp'] < ttl:
+                self._cache.move_to_end(cache_key)
+                return cache_entry
+            del self._cache[cache_key]
+            return None
+    
+    def _cache_put(self, cache_key: Any, entry: Dict[str, Any]):
+        """Store a cache entry, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self._cache[cache_key] = entry
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+    
     def _make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None,
                      use_cache: bool = True) -> Dict[str, Any]:
         """Make HTTP request with error handling and retries."""
-        url = urljoin(self.base_url, endpoint)
+        url = self.base_url + endpoint
         
         # Check cache for GET requests
-        cache_key = f"{method}:{url}:{json.dumps(params or {}, sort_keys=True)}"
-        if use_cache and self.enable_cache and method == 'GET' and cache_key in self._cache:
-            cache_entry = self._cache[cache_key]
-            if time.time() - cache_entry['timestamp'] < self.cache_ttl:
+        cache_key = _cache_key(method, url, params)
+        if use_cache and self.enable_cache and method == 'GET':
+            cache_entry = self._cache_get(cache_key)
+            if cache_entry is not None:
                 logger.debug(f"Cache hit for {cache_key}")
+                if 'error' in cache_entry:
+                    # A fresh error per hit, so callers never share a traceback or __context__
+                    raise _api_error(*cache_entry['error'])
                 return cache_entry['data']
         
+        body, extra_headers = _encode_body(data, self.compress_requests)
+        
         for attempt in range(self.max_retries + 1):
             try:
+                if self._bucket:
+                    self._bucket.acquire()
                 response = self.session.request(
                     method=method,
                     url=url,
-                    json=data,
+                    data=body,
+                    headers=extra_headers,
                     params=params,
                     timeout=self.timeout
                 )
                 
-                if response.status_code == 200:
-                    result = response.json()
+                if 200 <= response.status_code < 300:
+                    result = _success_body(response.status_code, response.content)
                     
                     # Cache successful GET responses
                     if use_cache and self.enable_cache and method == 'GET':
-                        self._cache[cache_key] = {
-                            'data': result,
-                            'timestamp': time.time()
-                        }
+                        self._cache_put(cache_key, {'data': result, 'timestamp': time.time()})
                     
                     return result
                 
                 elif response.status_code in [429, 500, 502, 503, 504]:
                     # Retry on rate limiting or server errors
                     if attempt < self.max_retries:
-                        delay = 2 ** attempt  # Exponential backoff
-                        logger.warning(f"Request failed with {response.status_code}, retrying in {delay}s...")
+                        delay = _retry_delay(attempt, response.headers.get('Retry-After'))
+                        logger.warning(f"Request failed with {response.status_code}, retrying in {delay:.2f}s...")
                         time.sleep(delay)
                         continue
                 
                 # Handle client errors and final server errors
-                try:
-                    error_data = response.json()
-                    raise FortitudeAPIError(
-                        message=error_data.get('message', 'Unknown error'),
-                        error_code=error_data.get('error_code'),
-                        status_code=response.status_code,
-                        request_id=error_data.get('request_id'),
-                        details=error_data.get('details')
-                    )
-                except json.JSONDecodeError:
-                    raise FortitudeAPIError(
-                        message=f"HTTP {response.status_code}: {response.text}",
-                        status_code=response.status_code
-                    )
+                error = _api_error(response.status_code, response.content)
+                
+                # Briefly remember missing resources so polling loops don't hammer the server
+                if response.status_code == 404 and use_cache and self.enable_cache and method == 'GET':
+                    self._cache_put(cache_key, {'error': (response.status_code, response.content),
+                                                'timestamp': time.time()})
+                raise error
             
             except requests.exceptions.RequestException as e:
                 if attempt < self.max_retries:
-                    delay = 2 ** attempt
-                    logger.warning(f"Request exception: {e}, retrying in {delay}s...")
+                    delay = _retry_delay(attempt)
+                    logger.warning(f"Request exception: {e}, retrying in {delay:.2f}s...")
                     time.sleep(delay)
                     continue
                 raise FortitudeAPIError(f"Request failed: {e}")
@@ -155,6 +336,18 @@ class FortitudeClient:
         """Get public health status."""
         return self._make_request('GET', '/health')
     
+    def ping(self) -> int:
+        """Check liveness by status code only; no retries, caching or JSON decoding."""
+        if self._bucket:
+            self._bucket.acquire()
+        try:
+            response = self.session.get(self.base_url + '/health', timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise FortitudeAPIError(f"Request failed: {e}")
+        if not 200 <= response.status_code < 300:
+            raise _api_error(response.status_code, response.content)
+        return response.status_code
+    
     def get_protected_health(self) -> Dict[str, Any]:
         """Get detailed health status (requires authentication)."""
         return self._make_request('GET', '/api/v1/health/protected')
@@ -177,6 +370,22 @@ class FortitudeClient:
         
         return self._make_request('POST', '/api/v1/research', data=data, use_cache=False)
     
+    def research_batch(self, queries: List[Dict[str, Any]], max_workers: int = 8) -> List[Any]:
+        """
+        Run several research queries, each given as keyword arguments for ``research()``.
+        
+        The API has no batch endpoint yet, so queries are sent in parallel over the pooled
+        session. Results keep input order; failures are returned in place as exceptions.
+        """
+        def run(query: Dict[str, Any]) -> Any:
+            try:
+                return self.research(**query)
+            except FortitudeAPIError as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, queries))
+    
     def get_research_result(self, research_id: str) -> Dict[str, Any]:
         """Get a specific research result by ID."""
         return self._make_request('GET', f'/api/v1/research/{research_id}')
@@ -189,6 +398,69 @@ class FortitudeClient:
         
         return self._make_request('GET', '/api/v1/research', params=params)
     
+    def iter_research_results(self, page_size: int = 100, query: str = None,
+                              stream: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all research results, fetching one page at a time.
+        
+        With ``stream=True`` each page is parsed incrementally with ijson instead of
+        being buffered and decoded in full, which keeps peak memory low for large pages.
+        """
+        offset = 0
+        while True:
+            params = {'limit': page_size, 'offset': offset}
+            if query:
+                params['query'] = query
+            
+            if stream:
+                items = self._stream_items('/api/v1/research', params)
+            else:
+                items = self._make_request('GET', '/api/v1/research', params=params)['data']['results']
+            
+            count = 0
+            for item in items:
+                count += 1
+                yield item
+            
+            if count < page_size:
+                return
+            offset += page_size
+    
+    def fetch_all_research_results(self, query: str = None, page_size: int = 100,
+                                   max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Fetch every research result, requesting the remaining pages in parallel.
+        
+        The first page reports ``total_count``; the rest are fetched concurrently over the
+        pooled session and merged in offset order.
+        """
+        first_page = self.list_research_results(limit=page_size, offset=0, query=query)['data']
+        results = list(first_page['results'])
+        offsets = range(page_size, first_page.get('total_count', 0), page_size)
+        if not offsets:
+            return results
+        
+        def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            return self.list_research_results(limit=page_size, offset=offset, query=query)['data']['results']
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page in executor.map(fetch_page, offsets):
+                results.extend(page)
+        return results
+    
+    def _stream_items(self, endpoint: str, params: Dict, prefix: str = 'data.results.item') -> Iterator[Any]:
+        """Stream list items from a response body without buffering it (requires ijson)."""
+        import ijson
+        
+        if self._bucket:
+            self._bucket.acquire()
+        with self.session.get(self.base_url + endpoint, params=params,
+                              timeout=self.timeout, stream=True) as response:
+            if not 200 <= response.status_code < 300:
+                raise _api_error(response.status_code, response.content)
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, prefix)
+    
     # Classification endpoints
     def classify(self, content: str, categories: List[str] = None, 
                 context_preferences: Dict = None) -> Dict[str, Any]:
@@ -244,8 +516,9 @@ class FortitudeClient:
         return self._make_request('GET', f'/api/v1/cache/{cache_id}')
     
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Close the session (shared sessions stay open for other clients)."""
+        if not self.share_session:
+            self.session.close()
     
     def __enter__(self):
         return self
@@ -263,8 +536,26 @@ class AsyncFortitudeClient:
                  timeout: int = None,
                  max_retries: int = None,
                  enable_cache: bool = False,
-                 cache_ttl: int = 300):
-        """Initialize the async Fortitude API client."""
+                 cache_ttl: int = 300,
+                 max_cache_entries: int = 1024,
+                 connector: aiohttp.TCPConnector = None,
+                 max_per_second: float = None,
+                 max_burst: int = None,
+                 negative_cache_ttl: float = 2,
+                 use_http2: bool = False,
+                 compress_requests: bool = False):
+        """
+        Initialize the async Fortitude API client.
+        
+        Pass a shared ``connector`` to let several clients reuse one connection pool;
+        the client will not close a connector it did not create.
+        
+        With ``use_http2=True`` requests go through an ``httpx.AsyncClient`` (requires
+        ``httpx[http2]``) so concurrent calls multiplex over a single connection.
+        
+        ``compress_requests=True`` gzips request bodies over 1KB; only enable it against
+        servers that accept ``Content-Encoding: gzip``.
+        """
         self.api_key = api_key or os.getenv('FORTITUDE_API_KEY')
         self.base_url = (base_url or os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')).rstrip('/')
         self.timeout = timeout or int(os.getenv('FORTITUDE_TIMEOUT', '30'))
@@ -281,19 +572,85 @@ class AsyncFortitudeClient:
         
         self.enable_cache = enable_cache
         self.cache_ttl = cache_ttl
-        self._cache = {}
+        self.max_cache_entries = max_cache_entries
+        self.negative_cache_ttl = negative_cache_ttl
+        self.compress_requests = compress_requests
+        self._cache = OrderedDict()
+        self.use_http2 = use_http2
+        self._connector = connector
         self._session = None
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._transport_errors = (aiohttp.ClientError,)
+        self._bucket = _TokenBucket(max_per_second, max_burst or max(1, int(max_per_second))) \
+            if max_per_second else None
     
     async def __aenter__(self):
+        if self.use_http2:
+            import httpx
+            
+            self._session = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+            self._transport_errors = (httpx.TransportError,)
+            return self
+        
+        connector = self._connector or aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            force_close=False,
+            enable_cleanup_closed=True
+        )
         self._session = aiohttp.ClientSession(
             headers=self.headers,
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=connector,
+            connector_owner=self._connector is None
         )
+        self._transport_errors = (aiohttp.ClientError,)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._session:
-            await self._session.close()
+            if self.use_http2:
+                await self._session.aclose()
+            else:
+                await self._session.close()
+    
+    # The event loop is single-threaded, so the async cache needs no lock
+    def _cache_get(self, cache_key: Any) -> Optional[Dict[str, Any]]:
+        """Return a fresh cache entry and mark it recently used; expired entries are dropped."""
+        cache_entry = self._cache.get(cache_key)
+        if cache_entry is None:
+            return None
+        ttl = self.negative_cache_ttl if 'error' in cache_entry else self.cache_ttl
+        if time.time() - cache_entry['timestamp'] < ttl:
+            self._cache.move_to_end(cache_key)
+            return cache_entry
+        del self._cache[cache_key]
+        return None
+    
+    def _cache_put(self, cache_key: Any, entry: Dict[str, Any]):
+        """Store a cache entry, evicting the least recently used one when full."""
+        self._cache[cache_key] = entry
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+    
+    async def _send(self, method: str, url: str, body: bytes = None, headers: Dict = None,
+                    params: Dict = None) -> Tuple[int, Any, bytes]:
+        """Send one request on the active backend and return (status, headers, body)."""
+        if self.use_http2:
+            response = await self._session.request(method, url, content=body, headers=headers, params=params)
+            return response.status_code, response.headers, response.content
+        
+        async with self._session.request(method=method, url=url, data=body, headers=headers,
+                                         params=params) as response:
+            return response.status, response.headers, await response.read()
     
     async def _make_request(self, method: str, endpoint: str, data: Dict = None, 
                            params: Dict = None, use_cache: bool = True) -> Dict[str, Any]:
@@ -301,67 +658,78 @@ class AsyncFortitudeClient:
         if not self._session:
             raise RuntimeError("Client not initialized. Use 'async with' statement.")
         
-        url = urljoin(self.base_url, endpoint)
+        url = self.base_url + endpoint
         
         # Check cache for GET requests
-        cache_key = f"{method}:{url}:{json.dumps(params or {}, sort_keys=True)}"
-        if use_cache and self.enable_cache and method == 'GET' and cache_key in self._cache:
-            cache_entry = self._cache[cache_key]
-            if time.time() - cache_entry['timestamp'] < self.cache_ttl:
+        cache_key = _cache_key(method, url, params)
+        if use_cache and self.enable_cache and method == 'GET':
+            cache_entry = self._cache_get(cache_key)
+            if cache_entry is not None:
+                if 'error' in cache_entry:
+                    # A fresh error per hit, so callers never share a traceback or __context__
+                    raise _api_error(*cache_entry['error'])
                 return cache_entry['data']
         
+        if method != 'GET':
+            return await self._fetch(method, url, data, params, cache_key, use_cache)
+        
+        # Coalesce concurrent identical GETs onto a single in-flight request
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(method, url, data, params, cache_key, use_cache))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # Shield so one cancelled caller does not cancel the request for the others
+        try:
+            return await asyncio.shield(task)
+        except FortitudeAPIError as e:
+            # Every coalesced caller gets its own error, so none share a traceback or __context__
+            error = FortitudeAPIError(e.message, e.error_code, e.status_code, e.request_id, e.details)
+        raise error
+    
+    async def _fetch(self, method: str, url: str, data: Optional[Dict], params: Optional[Dict],
+                     cache_key: Any, use_cache: bool) -> Dict[str, Any]:
+        """Send a request with retries, caching successful and 404 GET responses."""
+        request_body, extra_headers = _encode_body(data, self.compress_requests)
+        
         for attempt in range(self.max_retries + 1):
             try:
-                async with self._session.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    params=params
-                ) as response:
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        # Cache successful GET responses
-                        if use_cache and self.enable_cache and method == 'GET':
-                            self._cache[cache_key] = {
-                                'data': result,
-                                'timestamp': time.time()
-                            }
-                        
-                        return result
-                    
-                    elif response.status in [429, 500, 502, 503, 504]:
-                        if attempt < self.max_retries:
-                            delay = 2 ** attempt
-                            logger.warning(f"Request failed with {response.status}, retrying in {delay}s...")
-                            await asyncio.sleep(delay)
-                            continue
-                    
-                    # Handle errors
-                    try:
-                        error_data = await response.json()
-                        raise FortitudeAPIError(
-                            message=error_data.get('message', 'Unknown error'),
-                            error_code=error_data.get('error_code'),
-                            status_code=response.status,
-                            request_id=error_data.get('request_id'),
-                            details=error_data.get('details')
-                        )
-                    except aiohttp.ContentTypeError:
-                        text = await response.text()
-                        raise FortitudeAPIError(
-                            message=f"HTTP {response.status}: {text}",
-                            status_code=response.status
-                        )
+                if self._bucket:
+                    delay = self._bucket.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                status, headers, body = await self._send(method, url, request_body, extra_headers, params)
             
-            except aiohttp.ClientError as e:
+            except self._transport_errors as e:
                 if attempt < self.max_retries:
-                    delay = 2 ** attempt
-                    logger.warning(f"Request exception: {e}, retrying in {delay}s...")
+                    delay = _retry_delay(attempt)
+                    logger.warning(f"Request exception: {e}, retrying in {delay:.2f}s...")
                     await asyncio.sleep(delay)
                     continue
                 raise FortitudeAPIError(f"Request failed: {e}")
+            
+            if 200 <= status < 300:
+                result = _success_body(status, body)
+                
+                # Cache successful GET responses
+                if use_cache and self.enable_cache and method == 'GET':
+                    self._cache_put(cache_key, {'data': result, 'timestamp': time.time()})
+                
+                return result
+            
+            elif status in [429, 500, 502, 503, 504]:
+                if attempt < self.max_retries:
+                    delay = _retry_delay(attempt, headers.get('Retry-After'))
+                    logger.warning(f"Request failed with {status}, retrying in {delay:.2f}s...")
+                    await asyncio.sleep(delay)
+                    continue
+            
+            # Handle errors
+            error = _api_error(status, body)
+            
+            if status == 404 and use_cache and self.enable_cache and method == 'GET':
+                self._cache_put(cache_key, {'error': (status, body), 'timestamp': time.time()})
+            raise error
         
         raise FortitudeAPIError("Max retries exceeded")
     
@@ -370,6 +738,23 @@ class AsyncFortitudeClient:
         """Get public health status."""
         return await self._make_request('GET', '/health')
     
+    async def ping(self) -> int:
+        """Check liveness by status code only; no retries, caching or JSON decoding."""
+        if not self._session:
+            raise RuntimeError("Client not initialized. Use 'async with' statement.")
+        
+        if self._bucket:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            status, _, body = await self._send('GET', self.base_url + '/health')
+        except self._transport_errors as e:
+            raise FortitudeAPIError(f"Request failed: {e}")
+        if not 200 <= status < 300:
+            raise _api_error(status, body)
+        return status
+    
     async def research(self, query: str, context: str = None, priority: str = "medium",
                       audience_context: Dict = None, domain_context: Dict = None) -> Dict[str, Any]:
         """Perform a research query."""
@@ -387,6 +772,95 @@ class AsyncFortitudeClient:
         
         return await self._make_request('POST', '/api/v1/research', data=data, use_cache=False)
     
+    async def get_research_result(self, research_id: str) -> Dict[str, Any]:
+        """Get a specific research result by ID."""
+        return await self._make_request('GET', f'/api/v1/research/{research_id}')
+    
+    async def list_research_results(self, limit: int = 20, offset: int = 0, query: str = None) -> Dict[str, Any]:
+        """List research results with pagination."""
+        params = {'limit': limit, 'offset': offset}
+        if query:
+            params['query'] = query
+        
+        return await self._make_request('GET', '/api/v1/research', params=params)
+    
+    async def iter_research_results(self, page_size: int = 100, query: str = None,
+                                    stream: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all research results page by page (see FortitudeClient.iter_research_results)."""
+        offset = 0
+        while True:
+            params = {'limit': page_size, 'offset': offset}
+            if query:
+                params['query'] = query
+            
+            count = 0
+            if stream:
+                async for item in self._stream_items('/api/v1/research', params):
+                    count += 1
+                    yield item
+            else:
+                page = await self._make_request('GET', '/api/v1/research', params=params)
+                for item in page['data']['results']:
+                    count += 1
+                    yield item
+            
+            if count < page_size:
+                return
+            offset += page_size
+    
+    async def fetch_all_research_results(self, query: str = None, page_size: int = 100,
+                                         max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Fetch every research result, requesting the remaining pages concurrently."""
+        first_page = (await self.list_research_results(limit=page_size, offset=0, query=query))['data']
+        results = list(first_page['results'])
+        offsets = range(page_size, first_page.get('total_count', 0), page_size)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                page = await self.list_research_results(limit=page_size, offset=offset, query=query)
+                return page['data']['results']
+        
+        for page in await asyncio.gather(*(fetch_page(offset) for offset in offsets)):
+            results.extend(page)
+        return results
+    
+    async def _stream_items(self, endpoint: str, params: Dict,
+                            prefix: str = 'data.results.item') -> AsyncIterator[Any]:
+        """Stream list items from a response body without buffering it (requires ijson)."""
+        import ijson
+        
+        if not self._session:
+            raise RuntimeError("Client not initialized. Use 'async with' statement.")
+        
+        if self._bucket:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        url = self.base_url + endpoint
+        if self.use_http2:
+            request = self._session.stream('GET', url, params=params)
+        else:
+            request = self._session.get(url, params=params)
+        
+        async with request as response:
+            status = response.status_code if self.use_http2 else response.status
+            chunks = response.aiter_bytes() if self.use_http2 else response.content.iter_any()
+            if not 200 <= status < 300:
+                raise _api_error(status, b''.join([chunk async for chunk in chunks]))
+            
+            # Push-based parsing works the same for aiohttp and httpx byte streams
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix)
+            async for chunk in chunks:
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
+    
     async def classify(self, content: str, categories: List[str] = None, 
                       context_preferences: Dict = None) -> Dict[str, Any]:
         """Classify content."""
@@ -399,6 +873,49 @@ class AsyncFortitudeClient:
         
         return await self._make_request('POST', '/api/v1/classify', data=data, use_cache=False)
     
+    async def get_classification_result(self, classification_id: str) -> Dict[str, Any]:
+        """Get a specific classification result by ID."""
+        return await self._make_request('GET', f'/api/v1/classify/{classification_id}')
+    
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        return await self._make_request('GET', '/api/v1/cache/stats')
\ No newline at end of file
+        return await self._make_request('GET', '/api/v1/cache/stats')
+    
+    async def get_cache_entry(self, cache_id: str) -> Dict[str, Any]:
+        """Get a specific cache entry by ID."""
+        return await self._make_request('GET', f'/api/v1/cache/{cache_id}')
+    
+    # Batch helpers
+    async def _gather_bounded(self, fetch, ids: List[str], max_concurrency: int) -> List[Any]:
+        """Run fetch(id) for every id with at most max_concurrency requests in flight.
+        
+        Results are returned in input order; failures are returned in place as exceptions.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_one(item_id: str):
+            async with semaphore:
+                return await fetch(item_id)
+        
+        return await asyncio.gather(*(fetch_one(item_id) for item_id in ids), return_exceptions=True)
+    
+    async def batch_get_research_results(self, ids: List[str], max_concurrency: int = 16) -> List[Any]:
+        """Fetch several research results concurrently."""
+        return await self._gather_bounded(self.get_research_result, ids, max_concurrency)
+    
+    async def batch_get_classification_results(self, ids: List[str], max_concurrency: int = 16) -> List[Any]:
+        """Fetch several classification results concurrently."""
+        return await self._gather_bounded(self.get_classification_result, ids, max_concurrency)
+    
+    async def batch_get_cache_entries(self, ids: List[str], max_concurrency: int = 16) -> List[Any]:
+        """Fetch several cache entries concurrently."""
+        return await self._gather_bounded(self.get_cache_entry, ids, max_concurrency)
+    
+    async def research_batch(self, queries: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Any]:
+        """
+        Run several research queries, each given as keyword arguments for ``research()``.
+        
+        The API has no batch endpoint yet, so queries are sent concurrently over the shared
+        connection pool. Results keep input order; failures are returned in place as exceptions.
+        """
+        return await self._gather_bounded(lambda query: self.research(**query), queries, max_concurrency)
\ No newline at end of file
@@ -7,31 +7,143 @@ including concurrent request testing, cache hit rate validation, and
 response time measurements.
 """
 
+import argparse
 import asyncio
-import json
+import atexit
 import os
 import statistics
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from array import array
+from bisect import bisect_right, insort
+from collections import Counter
+from functools import partial
+from itertools import cycle, islice
 from typing import Dict, List, Tuple
 
-from fortitude_client import AsyncFortitudeClient, FortitudeClient, FortitudeAPIError
+import aiohttp
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the statistics module
+    np = None
+
+from fortitude_client import AsyncFortitudeClient, FortitudeClient
+
+
+class P2Quantile:
+    """Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+    
+    Keeps five markers regardless of sample count, so memory is constant and each
+    update is O(1). With tens of thousands of samples from a smooth latency
+    distribution the estimate is usually within about 1% of the exact percentile,
+    but on a few hundred samples tail estimates can be off by 20% or more.
+    """
+    
+    def __init__(self, p: float):
+        self.p = p
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+    
+    def add(self, x: float):
+        """Add one observation."""
+        q = self._heights
+        if len(q) < 5:
+            insort(q, x)
+            return
+        
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect_right(q, x) - 1
+        
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        
+        # Nudge the three middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < height < q[i + 1]:
+                    # Parabolic step would break ordering; fall back to linear
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+    
+    def value(self) -> float:
+        """Current estimate (exact while fewer than five observations have been seen)."""
+        q = self._heights
+        if len(q) < 5:
+            return q[min(len(q) - 1, int(round(self.p * (len(q) - 1))))] if q else 0.0
+        return q[2]
+
+
+# Streaming mode keeps exact samples up to this count, since P² is badly biased on small samples
+STREAMING_MIN_SAMPLES = 10_000
 
 
 class PerformanceTestResults:
-    """Container for performance test results."""
-    
-    def __init__(self):
-        self.response_times = []
+    """Container for performance test results.
+    
+    By default every response time is kept and percentiles are exact. Set
+    ``streaming`` (or the class-wide default via ``--streaming``) for long soak
+    tests: once STREAMING_MIN_SAMPLES results have arrived, the samples are folded
+    into P² percentile estimators and dropped, so memory stays flat from then on.
+    """
+    
+    streaming = False
+    
+    def __init__(self, streaming: bool = None):
+        if streaming is not None:
+            self.streaming = streaming
+        # Contiguous doubles rather than boxed floats; NumPy can view them without copying
+        self.response_times = array('d')
+        self._estimators = None
+        self._count = 0
+        self._total = 0.0
+        self._min = float('inf')
+        self._max = float('-inf')
         self.success_count = 0
         self.error_count = 0
         self.errors = []
         self.start_time = None
         self.end_time = None
+        self._stats_cache = None
+        self._stats_cache_end = None
     
     def add_result(self, response_time: float, success: bool, error: str = None):
         """Add a test result."""
-        self.response_times.append(response_time)
+        self._stats_cache = None
+        self._count += 1
+        self._total += response_time
+        if response_time < self._min:
+            self._min = response_time
+        if response_time > self._max:
+            self._max = response_time
+        if self._estimators is None:
+            self.response_times.append(response_time)
+            if self.streaming and len(self.response_times) >= STREAMING_MIN_SAMPLES:
+                self._estimators = {pct: P2Quantile(pct / 100) for pct in (50, 90, 95, 99)}
+                for estimator in self._estimators.values():
+                    for sample in self.response_times:
+                        estimator.add(sample)
+                self.response_times = None
+        else:
+            for estimator in self._estimators.values():
+                estimator.add(response_time)
         if success:
             self.success_count += 1
         else:
@@ -40,85 +152,116 @@ class PerformanceTestResults:
                 self.errors.append(error)
     
     def get_statistics(self) -> Dict:
-        """Calculate performance statistics."""
-        if not self.response_times:
+        """Calculate performance statistics (memoized until new results arrive or end_time changes)."""
+        if not self._count:
             return {}
+        if self._stats_cache is not None and self._stats_cache_end == self.end_time:
+            return self._stats_cache
         
         total_time = self.end_time - self.start_time if self.start_time and self.end_time else 0
-        total_requests = len(self.response_times)
+        total_requests = self._count
         
-        return {
+        self._stats_cache_end = self.end_time
+        self._stats_cache = {
             'total_requests': total_requests,
             'success_count': self.success_count,
             'error_count': self.error_count,
             'success_rate': (self.success_count / total_requests) * 100 if total_requests > 0 else 0,
             'total_duration': total_time,
             'requests_per_second': total_requests / total_time if total_time > 0 else 0,
-            'avg_response_time': statistics.mean(self.response_times),
-            'min_response_time': min(self.response_times),
-            'max_response_time': max(self.response_times),
-            'p50_response_time': statistics.median(self.response_times),
-            'p90_response_time': statistics.quantiles(self.response_times, n=10)[8] if len(self.response_times) >= 10 else max(self.response_times),
-            'p95_response_time': statistics.quantiles(self.response_times, n=20)[18] if len(self.response_times) >= 20 else max(self.response_times),
-            'p99_response_time': statistics.quantiles(self.response_times, n=100)[98] if len(self.response_times) >= 100 else max(self.response_times)
+            **self._latency_statistics()
+        }
+        return self._stats_cache
+    
+    def _latency_statistics(self) -> Dict:
+        """Summarize response times from the running totals plus one percentile pass."""
+        summary = {
+            'avg_response_time': self._total / self._count,
+            'min_response_time': self._min,
+            'max_response_time': self._max
         }
+        
+        if self._estimators is not None:
+            for pct, estimator in self._estimators.items():
+                summary[f'p{pct}_response_time'] = estimator.value()
+            return summary
+        
+        times = self.response_times
+        
+        if np is not None:
+            arr = np.frombuffer(times, dtype=np.float64)
+            # 'weibull' is the same estimator as statistics.quantiles' default exclusive method
+            p50, p90, p95, p99 = np.percentile(arr, [50, 90, 95, 99], method='weibull')
+            summary.update({
+                'p50_response_time': float(p50),
+                'p90_response_time': float(p90),
+                'p95_response_time': float(p95),
+                'p99_response_time': float(p99)
+            })
+            return summary
+        
+        # One sort for every cut point; cut i of n=100 equals cut i/10 of n=10 and so on
+        cuts = statistics.quantiles(times, n=100) if len(times) >= 10 else None
+        summary.update({
+            'p50_response_time': statistics.median(times),
+            'p90_response_time': cuts[89] if cuts else self._max,
+            'p95_response_time': cuts[94] if len(times) >= 20 else self._max,
+            'p99_response_time': cuts[98] if len(times) >= 100 else self._max
+        })
+        return summary
 
 
-def single_health_request(client: FortitudeClient) -> Tuple[float, bool, str]:
+async def single_health_request(client: AsyncFortitudeClient) -> Tuple[float, bool, str]:
     """Make a single health check request."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
-        client.get_health()
-        end_time = time.time()
-        return (end_time - start_time) * 1000, True, None
+        await client.ping()
+        return (time.perf_counter_ns() - start_ns) / 1e6, True, None
     except Exception as e:
-        end_time = time.time()
-        return (end_time - start_time) * 1000, False, str(e)
+        return (time.perf_counter_ns() - start_ns) / 1e6, False, str(e)
 
 
-def single_research_request(client: FortitudeClient, query: str) -> Tuple[float, bool, str]:
+async def single_research_request(client: AsyncFortitudeClient, query: str) -> Tuple[float, bool, str]:
     """Make a single research request."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
-        result = client.research(query=query, priority="medium")
-        end_time = time.time()
-        return (end_time - start_time) * 1000, True, None
+        await client.research(query=query, priority="medium")
+        return (time.perf_counter_ns() - start_ns) / 1e6, True, None
     except Exception as e:
-        end_time = time.time()
-        return (end_time - start_time) * 1000, False, str(e)
+        return (time.perf_counter_ns() - start_ns) / 1e6, False, str(e)
 
 
-def test_concurrent_health_checks(num_requests: int = 100, max_workers: int = 10) -> PerformanceTestResults:
+async def test_concurrent_health_checks(num_requests: int = 100, max_workers: int = 10) -> PerformanceTestResults:
     """Test concurrent health check requests."""
     print(f"🏥 Testing {num_requests} concurrent health checks with {max_workers} workers...")
     
     results = PerformanceTestResults()
-    results.start_time = time.time()
+    results.start_time = time.perf_counter()
     
-    def create_client_and_request():
-        client = FortitudeClient(
-            api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
-            base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
-        )
-        return single_health_request(client)
+    # A fixed pool of max_workers coroutines drains one shared iterator, so only
+    # max_workers tasks exist however large num_requests gets
+    pending = iter(range(num_requests))
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(create_client_and_request) for _ in range(num_requests)]
-        
-        for future in as_completed(futures):
-            response_time, success, error = future.result()
-            results.add_result(response_time, success, error)
+    async def worker(client: AsyncFortitudeClient):
+        for _ in pending:
+            results.add_result(*await single_health_request(client))
     
-    results.end_time = time.time()
+    async with AsyncFortitudeClient(
+        api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
+        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
+    ) as client:
+        await asyncio.gather(*(worker(client) for _ in range(min(max_workers, num_requests))))
+    
+    results.end_time = time.perf_counter()
     return results
 
 
-def test_concurrent_research_requests(num_requests: int = 50, max_workers: int = 10) -> PerformanceTestResults:
+async def test_concurrent_research_requests(num_requests: int = 50, max_workers: int = 10) -> PerformanceTestResults:
     """Test concurrent research requests."""
     print(f"🔬 Testing {num_requests} concurrent research requests with {max_workers} workers...")
     
     results = PerformanceTestResults()
-    results.start_time = time.time()
+    results.start_time = time.perf_counter()
     
     # Vary queries to test different scenarios
     queries = [
@@ -129,207 +272,207 @@ def test_concurrent_research_requests(num_requests: int = 50, max_workers: int =
         "Database connection pooling in Node.js"
     ]
     
-    def create_client_and_request(i):
-        client = FortitudeClient(
-            api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
-            base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
-        )
-        query = queries[i % len(queries)]
-        return single_research_request(client, query)
+    # The API has no batch endpoint, so each query is its own request, timed on its own
+    semaphore = asyncio.Semaphore(max_workers)
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(create_client_and_request, i) for i in range(num_requests)]
+    async def bounded_request(client: AsyncFortitudeClient, query: str) -> Tuple[float, bool, str]:
+        async with semaphore:
+            return await single_research_request(client, query)
+    
+    async with AsyncFortitudeClient(
+        api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
+        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
+    ) as client:
+        tasks = [bounded_request(client, query) for query in islice(cycle(queries), num_requests)]
         
-        for future in as_completed(futures):
-            response_time, success, error = future.result()
+        for response_time, success, error in await asyncio.gather(*tasks):
             results.add_result(response_time, success, error)
     
-    results.end_time = time.time()
+    results.end_time = time.perf_counter()
     return results
 
 
-async def test_async_concurrent_requests(num_requests: int = 100) -> PerformanceTestResults:
-    """Test async concurrent requests."""
-    print(f"⚡ Testing {num_requests} async concurrent requests...")
+async def test_async_concurrent_requests(num_requests: int = 100, http2: bool = False) -> PerformanceTestResults:
+    """Test async concurrent requests, optionally multiplexed over HTTP/2 (needs httpx[http2] and https)."""
+    print(f"⚡ Testing {num_requests} async concurrent requests{' over HTTP/2' if http2 else ''}...")
     
     results = PerformanceTestResults()
-    results.start_time = time.time()
+    results.start_time = time.perf_counter()
     
     async def single_async_request(client: AsyncFortitudeClient, i: int):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
-            await client.get_health()
-            end_time = time.time()
-            return (end_time - start_time) * 1000, True, None
+            await client.ping()
+            return (time.perf_counter_ns() - start_ns) / 1e6, True, None
         except Exception as e:
-            end_time = time.time()
-            return (end_time - start_time) * 1000, False, str(e)
+            return (time.perf_counter_ns() - start_ns) / 1e6, False, str(e)
     
     async with AsyncFortitudeClient(
         api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
-        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
+        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080'),
+        use_http2=http2
     ) as client:
         
         tasks = [single_async_request(client, i) for i in range(num_requests)]
-        task_results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for result in task_results:
-            if isinstance(result, tuple):
-                response_time, success, error = result
-                results.add_result(response_time, success, error)
-            else:
-                results.add_result(0, False, str(result))
-    
-    results.end_time = time.time()
+        # single_async_request catches its own errors, so every result is a tuple
+        for response_time, success, error in await asyncio.gather(*tasks):
+            results.add_result(response_time, success, error)
+    
+    results.end_time = time.perf_counter()
     return results
 
 
-def test_cache_hit_rate() -> Dict:
-    """Test cache hit rate effectiveness."""
+async def test_cache_hit_rate(client: FortitudeClient, num_hits: int = 9, max_concurrency: int = 4,
+                              num_serial_hits: int = 3) -> Dict:
+    """Test cache hit rate effectiveness: one cold request, then serial and concurrent repeats of it."""
     print("🗄️ Testing cache hit rate effectiveness...")
     
-    client = FortitudeClient(
-        api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
-        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080'),
-        enable_cache=True
-    )
-    
     query = "Cache effectiveness test query for performance validation"
-    times = []
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def timed_research() -> float:
+        async with semaphore:
+            start_ns = time.perf_counter_ns()
+            # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(client.research, query=query, priority="medium")
+            )
+            return (time.perf_counter_ns() - start_ns) / 1e6
     
     try:
-        # Make multiple identical requests
-        for i in range(10):
-            start_time = time.time()
-            client.research(query=query, priority="medium")
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000
-            times.append(response_time)
-            print(f"   Request {i+1}: {response_time:.1f}ms")
-            time.sleep(0.1)
+        # Warm the server-side cache; its latency is the uncached baseline, not a hit sample
+        first_request_time = await timed_research()
+        print(f"   Cold request: {first_request_time:.1f}ms")
         
-        # Calculate cache effectiveness
-        first_request_time = times[0]
-        avg_subsequent_time = statistics.mean(times[1:]) if len(times) > 1 else times[0]
+        # The cold request ran alone, so compare it with hits that also ran alone;
+        # concurrent hits include contention the baseline never saw
+        avg_serial_hit_time = statistics.fmean([await timed_research() for _ in range(num_serial_hits)])
+        print(f"   {num_serial_hits} serial cached requests: avg {avg_serial_hit_time:.1f}ms")
         
-        cache_improvement = ((first_request_time - avg_subsequent_time) / first_request_time) * 100
+        hits = PerformanceTestResults(streaming=False)
+        for response_time in await asyncio.gather(*(timed_research() for _ in range(num_hits))):
+            hits.add_result(response_time, True)
+        hit_stats = hits.get_statistics()
+        print(f"   {num_hits} cached requests: p50 {hit_stats['p50_response_time']:.1f}ms, "
+              f"p95 {hit_stats['p95_response_time']:.1f}ms")
+        
+        avg_subsequent_time = hit_stats['avg_response_time']
+        cache_improvement = ((first_request_time - avg_serial_hit_time) / first_request_time) * 100
         
         return {
             'first_request_time': first_request_time,
             'avg_subsequent_time': avg_subsequent_time,
+            'avg_serial_hit_time': avg_serial_hit_time,
+            'p50_hit_time': hit_stats['p50_response_time'],
+            'p95_hit_time': hit_stats['p95_response_time'],
             'cache_improvement_percent': cache_improvement,
-            'all_times': times,
+            'all_times': list(hits.response_times),
             'cache_hit_rate_estimate': max(0, cache_improvement)
         }
         
     except Exception as e:
         print(f"   ❌ Cache test error: {e}")
         return {'error': str(e)}
-    finally:
-        client.close()
 
 
-def test_rate_limiting() -> Dict:
-    """Test rate limiting behavior."""
+async def test_rate_limiting(num_requests: int = 100) -> Dict:
+    """Test rate limiting behavior with a single unthrottled burst."""
     print("🚦 Testing rate limiting behavior...")
     
-    client = FortitudeClient(
-        api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
-        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
-    )
+    base_url = os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080').rstrip('/')
+    headers = {'X-API-Key': os.getenv('FORTITUDE_API_KEY', 'test-key')}
     
-    rate_limit_hits = 0
-    successful_requests = 0
-    start_time = time.time()
+    # Raw session on purpose: the API client would retry 429s and hide them
+    async def probe(session: aiohttp.ClientSession) -> int:
+        async with session.get(base_url + '/health') as response:
+            return response.status
     
+    start_time = time.perf_counter()
     try:
-        # Make rapid requests to trigger rate limiting
-        for i in range(100):
-            try:
-                client.get_health()
-                successful_requests += 1
-            except FortitudeAPIError as e:
-                if e.status_code == 429:
-                    rate_limit_hits += 1
-                    print(f"   Rate limit hit on request {i+1}")
-                    break
-                else:
-                    print(f"   Unexpected error: {e}")
-            
-            # Very small delay
-            time.sleep(0.01)
-        
-        end_time = time.time()
-        
-        return {
-            'successful_requests': successful_requests,
-            'rate_limit_hits': rate_limit_hits,
-            'total_time': end_time - start_time,
-            'requests_per_second': successful_requests / (end_time - start_time)
-        }
-        
+        async with aiohttp.ClientSession(headers=headers) as session:
+            statuses = await asyncio.gather(*(probe(session) for _ in range(num_requests)),
+                                            return_exceptions=True)
     except Exception as e:
         return {'error': str(e)}
-    finally:
-        client.close()
+    end_time = time.perf_counter()
+    
+    failures = [status for status in statuses if isinstance(status, Exception)]
+    counts = Counter(status for status in statuses if isinstance(status, int))
+    if not counts:
+        # No request got a response (e.g. connection refused), so there is nothing to report
+        return {'error': f"all {len(failures)} requests failed: {type(failures[0]).__name__}: {failures[0]}"}
+    
+    unexpected = {status: n for status, n in counts.items() if status not in (200, 429)}
+    return {
+        'successful_requests': counts[200],
+        'rate_limit_hits': counts[429],
+        'errors': len(failures) + sum(unexpected.values()),
+        'unexpected_statuses': unexpected,
+        'error_types': Counter(type(failure).__name__ for failure in failures),
+        'total_time': end_time - start_time,
+        'requests_per_second': counts[200] / (end_time - start_time)
+    }
 
 
 def print_performance_report(test_name: str, results: PerformanceTestResults):
     """Print formatted performance test results."""
     stats = results.get_statistics()
     
-    print(f"\n📊 {test_name} Results:")
-    print("=" * 60)
-    print(f"   Total Requests: {stats.get('total_requests', 0)}")
-    print(f"   Success Rate: {stats.get('success_rate', 0):.1f}%")
-    print(f"   Total Duration: {stats.get('total_duration', 0):.2f}s")
-    print(f"   Requests/Second: {stats.get('requests_per_second', 0):.1f}")
-    print()
-    print("   Response Times (ms):")
-    print(f"     Average: {stats.get('avg_response_time', 0):.1f}")
-    print(f"     Minimum: {stats.get('min_response_time', 0):.1f}")
-    print(f"     Maximum: {stats.get('max_response_time', 0):.1f}")
-    print(f"     P50 (Median): {stats.get('p50_response_time', 0):.1f}")
-    print(f"     P90: {stats.get('p90_response_time', 0):.1f}")
-    print(f"     P95: {stats.get('p95_response_time', 0):.1f}")
-    print(f"     P99: {stats.get('p99_response_time', 0):.1f}")
-    
-    # Performance target validation
-    print("\n   🎯 Performance Target Validation:")
+    # Assemble the whole report first so concurrent suites never interleave their lines
+    lines = [
+        f"\n📊 {test_name} Results:",
+        "=" * 60,
+        f"   Total Requests: {stats.get('total_requests', 0)}",
+        f"   Success Rate: {stats.get('success_rate', 0):.1f}%",
+        f"   Total Duration: {stats.get('total_duration', 0):.2f}s",
+        f"   Requests/Second: {stats.get('requests_per_second', 0):.1f}",
+        "",
+        "   Response Times (ms):",
+        f"     Average: {stats.get('avg_response_time', 0):.1f}",
+        f"     Minimum: {stats.get('min_response_time', 0):.1f}",
+        f"     Maximum: {stats.get('max_response_time', 0):.1f}",
+        f"     P50 (Median): {stats.get('p50_response_time', 0):.1f}",
+        f"     P90: {stats.get('p90_response_time', 0):.1f}",
+        f"     P95: {stats.get('p95_response_time', 0):.1f}",
+        f"     P99: {stats.get('p99_response_time', 0):.1f}",
+        # Performance target validation
+        "\n   🎯 Performance Target Validation:"
+    ]
+    
     avg_time = stats.get('avg_response_time', float('inf'))
     success_rate = stats.get('success_rate', 0)
     rps = stats.get('requests_per_second', 0)
     
     if avg_time < 100:
-        print("     ✅ Sub-100ms average response time: PASSED")
+        lines.append("     ✅ Sub-100ms average response time: PASSED")
     else:
-        print(f"     ❌ Sub-100ms average response time: FAILED ({avg_time:.1f}ms)")
+        lines.append(f"     ❌ Sub-100ms average response time: FAILED ({avg_time:.1f}ms)")
     
     if success_rate >= 99:
-        print("     ✅ >99% success rate: PASSED")
+        lines.append("     ✅ >99% success rate: PASSED")
     elif success_rate >= 95:
-        print("     ⚠️  >95% success rate: ACCEPTABLE")
+        lines.append("     ⚠️  >95% success rate: ACCEPTABLE")
     else:
-        print(f"     ❌ >95% success rate: FAILED ({success_rate:.1f}%)")
+        lines.append(f"     ❌ >95% success rate: FAILED ({success_rate:.1f}%)")
     
     if rps >= 10:
-        print("     ✅ Adequate throughput: PASSED")
+        lines.append("     ✅ Adequate throughput: PASSED")
     else:
-        print(f"     ⚠️  Low throughput: {rps:.1f} RPS")
+        lines.append(f"     ⚠️  Low throughput: {rps:.1f} RPS")
     
     if results.errors:
-        print(f"\n   ⚠️  Error Summary ({len(results.errors)} errors):")
-        error_counts = {}
-        for error in results.errors[:10]:  # Show first 10 errors
-            error_type = error.split(':')[0] if ':' in error else error
-            error_counts[error_type] = error_counts.get(error_type, 0) + 1
-        
-        for error_type, count in error_counts.items():
-            print(f"     {error_type}: {count}")
+        lines.append(f"\n   ⚠️  Error Summary ({len(results.errors)} errors):")
+        # Show first 10 errors, grouped by the text before the first colon
+        error_counts = Counter(error.split(':', 1)[0] for error in results.errors[:10])
+        lines.extend(f"     {error_type}: {count}" for error_type, count in error_counts.most_common())
+    
+    print("\n".join(lines))
 
 
-def validate_sprint_006_targets():
-    """Validate Sprint 006 performance targets."""
+async def validate_sprint_006_targets(client: FortitudeClient, all_results: Dict[str, PerformanceTestResults] = None,
+                                      cache_results: Dict = None):
+    """Validate Sprint 006 performance targets, reusing suite results already collected by main."""
     print("🎯 Sprint 006 Performance Target Validation")
     print("=" * 60)
     
@@ -337,7 +480,11 @@ def validate_sprint_006_targets():
     
     # Target 1: 100+ concurrent requests
     print("🔥 Testing 100+ concurrent request handling...")
-    health_results = test_concurrent_health_checks(num_requests=120, max_workers=15)
+    health_results = (all_results or {}).get("Concurrent Health Checks")
+    if health_results is not None and health_results.get_statistics().get('total_requests', 0) >= 100:
+        print("   Reusing Concurrent Health Checks results")
+    else:
+        health_results = await test_concurrent_health_checks(num_requests=120, max_workers=15)
     health_stats = health_results.get_statistics()
     
     if health_stats.get('success_rate', 0) >= 95:
@@ -345,10 +492,13 @@ def validate_sprint_006_targets():
         targets_met.append("concurrent_requests")
     else:
         print(f"   ❌ 100+ concurrent requests: FAILED ({health_stats.get('success_rate', 0):.1f}% success)")
+        # Cache latency is meaningless against a server that cannot serve health checks
+        cache_results = {'error': "skipped after the concurrent request target failed"}
     
     # Target 2: Sub-100ms latency for cached requests
     print("\n⚡ Testing sub-100ms cached request latency...")
-    cache_results = test_cache_hit_rate()
+    if cache_results is None:
+        cache_results = await test_cache_hit_rate(client)
     
     if 'error' not in cache_results:
         avg_cached_time = cache_results.get('avg_subsequent_time', float('inf'))
@@ -383,21 +533,25 @@ def validate_sprint_006_targets():
     return targets_met
 
 
-async def main():
+async def main(http2: bool = False, sequential: bool = False):
     """Run comprehensive performance tests."""
     print("⚡ Fortitude API - Performance Testing Suite")
     print("=" * 60)
     
+    # One pooled sync client for the whole run keeps connections and DNS warm between suites.
+    # Client-side caching stays off so every call reaches the server.
+    client = FortitudeClient(
+        api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
+        base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080'),
+        pool_maxsize=64
+    )
+    atexit.register(client.close)
+    
     # Check API connectivity first
     try:
-        client = FortitudeClient(
-            api_key=os.getenv('FORTITUDE_API_KEY', 'test-key'),
-            base_url=os.getenv('FORTITUDE_BASE_URL', 'http://localhost:8080')
-        )
         health = client.get_health()
         print(f"🏥 Server status: {health['status']}")
         print(f"📝 Server version: {health['version']}")
-        client.close()
     except Exception as e:
         print(f"❌ Cannot connect to API: {e}")
         print("💡 Make sure the API server is running and environment variables are set")
@@ -409,43 +563,57 @@ async def main():
     test_suites = [
         ("Concurrent Health Checks", lambda: test_concurrent_health_checks(100, 10)),
         ("Concurrent Research Requests", lambda: test_concurrent_research_requests(50, 8)),
-        ("Async Concurrent Requests", lambda: asyncio.run(test_async_concurrent_requests(100))),
+        ("Async Concurrent Requests", lambda: test_async_concurrent_requests(100, http2)),
     ]
     
+    # The suites share no state, so by default they load the server at the same time
+    if sequential:
+        outcomes = []
+        for _, test_func in test_suites:
+            try:
+                outcomes.append(await test_func())
+            except Exception as e:
+                outcomes.append(e)
+    else:
+        outcomes = await asyncio.gather(*(test_func() for _, test_func in test_suites), return_exceptions=True)
+    
     all_results = {}
     
-    for test_name, test_func in test_suites:
-        try:
-            results = test_func()
-            all_results[test_name] = results
-            print_performance_report(test_name, results)
-        except Exception as e:
-            print(f"❌ {test_name} failed: {e}")
-        
-        time.sleep(1)  # Brief pause between tests
+    for (test_name, _), outcome in zip(test_suites, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} failed: {outcome}")
+        else:
+            all_results[test_name] = outcome
+            print_performance_report(test_name, outcome)
     
     # Cache and rate limiting tests
     print("\n🗄️ Cache Performance Test:")
-    cache_results = test_cache_hit_rate()
+    cache_results = await test_cache_hit_rate(client)
     if 'error' not in cache_results:
         print(f"   First request: {cache_results['first_request_time']:.1f}ms")
         print(f"   Avg subsequent: {cache_results['avg_subsequent_time']:.1f}ms")
+        print(f"   Avg serial hit: {cache_results['avg_serial_hit_time']:.1f}ms")
+        print(f"   Cached p50/p95: {cache_results['p50_hit_time']:.1f}ms / {cache_results['p95_hit_time']:.1f}ms")
         print(f"   Cache improvement: {cache_results['cache_improvement_percent']:.1f}%")
     else:
         print(f"   ❌ Error: {cache_results['error']}")
     
     print("\n🚦 Rate Limiting Test:")
-    rate_results = test_rate_limiting()
+    rate_results = await test_rate_limiting()
     if 'error' not in rate_results:
         print(f"   Successful requests: {rate_results['successful_requests']}")
         print(f"   Rate limit hits: {rate_results['rate_limit_hits']}")
+        if rate_results['errors']:
+            details = [f"HTTP {status} x{n}" for status, n in rate_results['unexpected_statuses'].items()]
+            details += [f"{name} x{n}" for name, n in rate_results['error_types'].items()]
+            print(f"   Unexpected errors: {rate_results['errors']} ({', '.join(details)})")
         print(f"   Requests/second: {rate_results['requests_per_second']:.1f}")
     else:
         print(f"   ❌ Error: {rate_results['error']}")
     
     # Sprint 006 target validation
     print("\n" + "=" * 60)
-    targets_met = validate_sprint_006_targets()
+    targets_met = await validate_sprint_006_targets(client, all_results, cache_results)
     
     # Generate summary report
     print("\n📋 Performance Test Summary Report")
@@ -455,14 +623,9 @@ async def main():
     print(f"🎯 Sprint 006 Targets Met: {len(targets_met)}/3")
     
     if all_results:
-        overall_success_rate = statistics.mean([
-            results.get_statistics().get('success_rate', 0) 
-            for results in all_results.values()
-        ])
-        overall_avg_response = statistics.mean([
-            results.get_statistics().get('avg_response_time', 0) 
-            for results in all_results.values()
-        ])
+        suite_stats = [results.get_statistics() for results in all_results.values()]
+        overall_success_rate = statistics.mean([stats.get('success_rate', 0) for stats in suite_stats])
+        overall_avg_response = statistics.mean([stats.get('avg_response_time', 0) for stats in suite_stats])
         
         print(f"📊 Overall Success Rate: {overall_success_rate:.1f}%")
         print(f"⏱️  Overall Avg Response Time: {overall_avg_response:.1f}ms")
@@ -471,4 +634,16 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Fortitude API performance tests')
+    parser.add_argument('--http2', action='store_true',
+                        help='Multiplex the async concurrent test over HTTP/2 (requires httpx[http2] and an https URL)')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Run the load suites one after another instead of concurrently')
+    parser.add_argument('--streaming', action='store_true',
+                        help=f'Switch to streaming P² percentile estimates after {STREAMING_MIN_SAMPLES} '
+                             f'samples per suite, for long soak tests')
+    args = parser.parse_args()
+    
+    PerformanceTestResults.streaming = args.streaming
+    
+    asyncio.run(main(http2=args.http2, sequential=args.sequential))
\ No newline at end of file
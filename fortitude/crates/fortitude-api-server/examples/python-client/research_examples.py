@@ -182,24 +182,26 @@ def batch_research_example(client: FortitudeClient):
     
     results = []
     
-    for i, query in enumerate(queries, 1):
+    # Run the queries in parallel; a small worker count keeps within the rate limit
+    outcomes = client.research_batch(
+        [{'query': query, 'priority': "medium"} for query in queries],
+        max_workers=2
+    )
+    
+    for i, (query, result) in enumerate(zip(queries, outcomes), 1):
         print(f"🔍 Query {i}: {query}")
-        try:
-            result = client.research(query=query, priority="medium")
-            results.append({
-                'query': query,
-                'total_count': result['data']['total_count'],
-                'processing_time': result['data']['processing_time_ms'],
-                'top_result': result['data']['results'][0] if result['data']['results'] else None
-            })
-            print(f"   ✅ {result['data']['total_count']} results in {result['data']['processing_time_ms']}ms")
-            
-            # Small delay to respect rate limiting
-            time.sleep(0.5)
-            
-        except FortitudeAPIError as e:
-            print(f"   ❌ Error: {e}")
-            results.append({'query': query, 'error': str(e)})
+        if isinstance(result, Exception):
+            print(f"   ❌ Error: {result}")
+            results.append({'query': query, 'error': str(result)})
+            continue
+        
+        results.append({
+            'query': query,
+            'total_count': result['data']['total_count'],
+            'processing_time': result['data']['processing_time_ms'],
+            'top_result': result['data']['results'][0] if result['data']['results'] else None
+        })
+        print(f"   ✅ {result['data']['total_count']} results in {result['data']['processing_time_ms']}ms")
     
     print("\n📊 Batch Results Summary:")
     for result in results:
@@ -221,9 +223,9 @@ def cache_demonstration_example(client: FortitudeClient):
     try:
         # First request (likely cache miss)
         print("🔍 First request (cache miss expected)...")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result1 = client.research(query=query, priority="medium")
-        first_duration = time.time() - start_time
+        first_duration = (time.perf_counter_ns() - start_ns) / 1e9
         first_processing_time = result1['data']['processing_time_ms']
         
         print(f"   ⏱️  Total time: {first_duration:.3f}s")
@@ -234,9 +236,9 @@ def cache_demonstration_example(client: FortitudeClient):
         
         # Second request (likely cache hit)
         print("\n🔍 Second request (cache hit expected)...")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result2 = client.research(query=query, priority="medium")
-        second_duration = time.time() - start_time
+        second_duration = (time.perf_counter_ns() - start_ns) / 1e9
         second_processing_time = result2['data']['processing_time_ms']
         
         print(f"   ⏱️  Total time: {second_duration:.3f}s")
@@ -0,0 +1,27 @@
+"""Unit tests for the latency statistics in performance_test.py"""
+
+import pytest
+
+from performance_test import STREAMING_MIN_SAMPLES, P2Quantile, PerformanceTestResults
+
+
+def test_p2_quantile_tracks_exact_percentiles():
+    """Test that P² estimates stay within 2% of exact percentiles on a large sample"""
+    np = pytest.importorskip("numpy")
+    samples = np.random.default_rng(0).lognormal(3, 0.5, STREAMING_MIN_SAMPLES)
+    
+    for pct in (50, 90, 95, 99):
+        estimator = P2Quantile(pct / 100)
+        for sample in samples:
+            estimator.add(float(sample))
+        assert estimator.value() == pytest.approx(np.percentile(samples, pct), rel=0.02)
+
+
+def test_streaming_results_stay_exact_below_threshold():
+    """Test that streaming mode reports exact percentiles until STREAMING_MIN_SAMPLES"""
+    exact, streaming = PerformanceTestResults(), PerformanceTestResults(streaming=True)
+    for i in range(100):
+        exact.add_result(float(i * i % 97), True)
+        streaming.add_result(float(i * i % 97), True)
+    
+    assert streaming.get_statistics() == exact.get_statistics()